@@ -2,49 +2,107 @@
 Web Music Quiz - Flask web interface for the live music quiz
 """
 
+# eventlet must patch the stdlib (sockets, threading, time) before anything else imports it
+import eventlet
+eventlet.monkey_patch()
+
+import hashlib
 import os
+import threading
 import time
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Sequence, Tuple
 
-from flask import Flask, render_template, request, jsonify, session, redirect, url_for
-from flask_socketio import SocketIO, emit
+from flask import Flask, render_template, request, jsonify, session, redirect, url_for, g
+from flask.json.provider import JSONProvider
+from flask_socketio import SocketIO, emit, join_room
 
+import requests
 import spotipy
+import urllib3
+from requests.adapters import HTTPAdapter
 from spotipy.oauth2 import SpotifyOAuth
-from spotipy.cache_handler import FlaskSessionCacheHandler
+from spotipy.cache_handler import FlaskSessionCacheHandler, MemoryCacheHandler
 
 from dotenv import load_dotenv
-from rapidfuzz import fuzz
+import numpy as np
+import orjson
+from rapidfuzz import process, utils
+from rapidfuzz.distance import Indel
 
 # --- Env & app setup ---
 load_dotenv()  # local dev convenience; harmless in prod
 
+class OrjsonProvider(JSONProvider):
+    """Serve jsonify(), request.json and |tojson through orjson.
+
+    Supports the json.dumps options that map onto orjson (default, sort_keys,
+    indent=2, compact separators as used by the session serializer); anything
+    else raises TypeError rather than being ignored.
+    """
+    def _encode(self, obj, default=None, sort_keys=False, indent=None, separators=None, **kwargs) -> bytes:
+        if kwargs:
+            raise TypeError(f"orjson does not support: {', '.join(sorted(kwargs))}")
+        if separators is not None and tuple(separators) != (",", ":"):
+            raise TypeError("orjson only produces compact separators (',', ':')")
+        option = 0
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            if indent != 2:
+                raise TypeError("orjson only supports indent=2")
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=default, option=option)
+
+    def dumps(self, obj, **kwargs) -> str:
+        return self._encode(obj, **kwargs).decode()
+
+    def loads(self, s, **kwargs):
+        if kwargs:
+            raise TypeError(f"orjson does not support: {', '.join(sorted(kwargs))}")
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        if args and kwargs:
+            raise TypeError("app.json.response() takes either args or kwargs, not both")
+        if kwargs:
+            obj = kwargs
+        elif len(args) == 1:
+            obj = args[0]
+        else:
+            obj = list(args) or None
+        # Skip the bytes -> str -> bytes round trip that dumps() would cost
+        return self._app.response_class(self._encode(obj), mimetype="application/json")
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 app.config['SECRET_KEY'] = os.environ.get("FLASK_SECRET_KEY", "dev-only-secret")
 
-# In prod, lock this down to your domains if embedding:
+# In prod, lock this down to your domains if embedding.
+# A frozenset: engine.io checks each connection's Origin with `in`, so this makes it a hash lookup.
+CORS_ORIGINS = frozenset({
+    "http://127.0.0.1:5002",
+    "http://localhost:5002",
+    "https://mollyrudisill.com",
+    "https://www.mollyrudisill.com",
+    "https://music-quiz-app-waru.onrender.com",
+    "https://quiz.mollyrudisill.com",
+})
 socketio = SocketIO(
     app,
-    cors_allowed_origins=[
-        "http://127.0.0.1:5002",
-        "http://localhost:5002",
-        "https://mollyrudisill.com",
-        "https://www.mollyrudisill.com",
-        "https://music-quiz-app-waru.onrender.com",
-        "https://quiz.mollyrudisill.com",
-    ],
-    async_mode="threading"
+    cors_allowed_origins=CORS_ORIGINS,
+    async_mode="eventlet"
 )
 
 # --- Spotify OAuth factory (session-based token cache) ---
-def make_oauth():
+def make_oauth(cache_handler=None):
     scope = (
         "user-read-currently-playing "
         "user-read-playback-state "
         "user-library-read "
         "user-modify-playback-state"
     )
-    cache_handler = FlaskSessionCacheHandler(session)
+    if cache_handler is None:
+        cache_handler = FlaskSessionCacheHandler(session)
     return SpotifyOAuth(
         client_id=os.getenv("SPOTIPY_CLIENT_ID"),
         client_secret=os.getenv("SPOTIPY_CLIENT_SECRET"),
@@ -55,55 +113,217 @@ def make_oauth():
         open_browser=False,
     )
 
+def get_oauth():
+    """Return the SpotifyOAuth for the current request, building it on first use."""
+    if 'oauth' not in g:
+        g.oauth = make_oauth()
+    return g.oauth
+
+@app.teardown_request
+def drop_oauth(exc=None):
+    g.pop('oauth', None)
+    g.pop('sp', None)
+
+# --- Shared HTTP session for Spotify API calls ---
+class _SharedSession(requests.Session):
+    """Session shared by every Spotipy client; Spotify.__del__ closes its session, so ignore that."""
+    def close(self):
+        pass
+
+def _build_spotify_session() -> requests.Session:
+    """Pooled keep-alive session with the same retry policy Spotipy builds for itself."""
+    retry = urllib3.Retry(
+        total=spotipy.Spotify.max_retries,
+        connect=None,
+        read=False,
+        allowed_methods=frozenset(['GET', 'POST', 'PUT', 'DELETE']),
+        status=spotipy.Spotify.max_retries,
+        backoff_factor=0.3,
+        status_forcelist=spotipy.Spotify.default_retry_codes,
+    )
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retry)
+    sess = _SharedSession()
+    sess.mount('https://', adapter)
+    return sess
+
+_spotify_session = _build_spotify_session()
+
+# --- Per-session Spotipy clients ---
+# Building spotipy.Spotify on every call is wasted work; reuse one per session token.
+SP_CACHE_TTL = 300.0  # seconds
+_sp_cache: Dict[str, Tuple[spotipy.Spotify, float]] = {}  # token hash -> (client, created_at)
+_sp_cache_lock = threading.Lock()
+
+# --- Short-lived playback cache ---
+# Polling clients hit /api/current-track far more often than the track changes,
+# so reuse a session's last current_playback() result for a moment.
+PLAYBACK_CACHE_TTL = 1.0  # seconds
+_playback_cache: Dict[str, Tuple[float, Optional[Dict]]] = {}  # token hash -> (fetched_at, track)
+_playback_cache_lock = threading.Lock()
+
+# --- Scoring tables ---
+# Points indexed by int(similarity %), 0-100, so scoring is a lookup rather than an if-ladder.
+# Title: >=90 -> 70, >=70 -> 50, >=50 -> 30 (max 70). Artist: >=90 -> 30, >=70 -> 20, >=50 -> 10 (max 30).
+TITLE_POINTS = bytes([70 if s >= 90 else 50 if s >= 70 else 30 if s >= 50 else 0 for s in range(101)])
+ARTIST_POINTS = bytes([30 if s >= 90 else 20 if s >= 70 else 10 if s >= 50 else 0 for s in range(101)])
+
+MIN_SIMILARITY = 0.5  # below this neither title nor artist earns points
+
+def cheap_reject(a: str, b: str, min_ratio: float) -> bool:
+    """True if a and b can't reach min_ratio normalized Indel similarity, judging by length alone.
+
+    The similarity is 2 * LCS / (len(a) + len(b)), and the LCS is at most the
+    shorter length, so this is a true upper bound and rejecting on it never changes a score.
+    An empty string is always rejected: default_process empties punctuation-only text
+    ("?", "!!!"), and two empty strings would otherwise count as a perfect match.
+    """
+    la, lb = len(a), len(b)
+    if not la or not lb:
+        return True
+    return 2 * min(la, lb) / (la + lb) < min_ratio
+
+# --- Server-side answers ---
+# Tracks we've seen playing, so /api/submit-guess can score against the real
+# answer by id. Stores the display strings plus their default_process form.
+MAX_ANSWERS = 1024
+_answers: Dict[str, Tuple[str, str, str, str]] = {}  # track id -> (title, artist, proc_title, proc_artist)
+_answers_lock = threading.Lock()
+
+def remember_answer(track: Dict):
+    with _answers_lock:
+        if track['id'] in _answers:
+            return
+        if len(_answers) >= MAX_ANSWERS:
+            del _answers[next(iter(_answers))]  # oldest first
+        _answers[track['id']] = (
+            track['title'],
+            track['artist'],
+            utils.default_process(track['title']),
+            utils.default_process(track['artist']),
+        )
+
 # --- Quiz logic that fetches a per-request Spotify client ---
 class WebMusicQuiz:
     """Web version of the music quiz (per-request Spotify client)."""
     def __init__(self):
-        pass  # no global Spotipy client; we bind per request
+        pass  # no global Spotipy client; clients are bound per session (see _sp_cache)
 
-    def _get_sp(self):
+    def _get_sp(self, oauth=None):
         """Return a Spotipy client for the current session, or None if not logged in."""
-        oauth = make_oauth()
-        token = oauth.get_cached_token()
+        if oauth is None and 'sp' in g:
+            return g.sp  # already built by require_spotify for this /api/ request
+        if oauth is not None:
+            # Explicit oauth (e.g. the monitor loop) isn't tied to the Flask session; don't share it
+            if not oauth.get_cached_token():
+                return None
+            return spotipy.Spotify(auth_manager=oauth, requests_session=_spotify_session)
+
+        key = self._session_key()
+        if not key:
+            return None
+        now = time.time()
+        with _sp_cache_lock:
+            cached = _sp_cache.get(key)
+        if cached and now - cached[1] < SP_CACHE_TTL:
+            return cached[0]
+        # Spotipy will auto-refresh access token via this oauth/cache handler. Its
+        # FlaskSessionCacheHandler reads the session proxy, so later requests can reuse it.
+        sp = spotipy.Spotify(auth_manager=get_oauth(), requests_session=_spotify_session)
+        with _sp_cache_lock:
+            for stale in [k for k, (_, ts) in _sp_cache.items() if now - ts >= SP_CACHE_TTL]:
+                del _sp_cache[stale]
+            _sp_cache[key] = (sp, now)
+        return sp
+
+    def _session_key(self, oauth=None) -> Optional[str]:
+        """Cache key for the session: a hash of its access token (never the token itself).
+
+        A token refresh changes the key, which is what retires the old cache entries.
+        """
+        token = (oauth or get_oauth()).get_cached_token()
         if not token:
             return None
-        # Spotipy will auto-refresh access token via this oauth/cache handler
-        return spotipy.Spotify(auth_manager=oauth)
+        return hashlib.sha256(token['access_token'].encode()).hexdigest()
 
-    def get_currently_playing(self) -> Optional[Dict]:
+    def get_currently_playing(self, oauth=None) -> Optional[Dict]:
+        """Return the session's current track; pass oauth when running outside a request."""
         try:
-            sp = self._get_sp()
+            sp = self._get_sp(oauth)
             if not sp:
                 return None
-            current = sp.current_playback()
-            if not current or not current.get('is_playing', False):
-                return None
-            item = current.get('item')
-            if not item or item.get('type') != 'track':
-                return None
-            return {
-                'id': item['id'],
-                'title': item['name'],
-                'artist': ', '.join([artist['name'] for artist in item['artists']]),
-                'album': item['album']['name'],
-                'year': item['album']['release_date'][:4] if item['album']['release_date'] else 'Unknown',
-                'duration_ms': item['duration_ms'],
-                'popularity': item['popularity'],
-                'progress_ms': current.get('progress_ms', 0),
-                'device': current.get('device', {}).get('name', 'Unknown Device'),
-                'image_url': item['album']['images'][0]['url'] if item['album']['images'] else None
-            }
+            key = self._session_key(oauth)
+            now = time.time()
+            with _playback_cache_lock:
+                cached = _playback_cache.get(key)
+            if cached and now - cached[0] < PLAYBACK_CACHE_TTL:
+                return cached[1]
+
+            track = self._track_from_playback(sp.current_playback())
+            self._store_playback(key, track)
+            return track
         except Exception as e:
             print(f"Error getting currently playing: {e}")
             return None
 
-    def skip_to_next_track(self) -> bool:
+    def _store_playback(self, key: str, track: Optional[Dict]):
+        now = time.time()
+        with _playback_cache_lock:
+            # Drop expired entries so tokens from ended sessions don't pile up
+            for stale in [k for k, (ts, _) in _playback_cache.items() if now - ts >= PLAYBACK_CACHE_TTL]:
+                del _playback_cache[stale]
+            _playback_cache[key] = (now, track)
+
+    def _track_from_playback(self, current: Optional[Dict]) -> Optional[Dict]:
+        if not current or not current.get('is_playing', False):
+            return None
+        item = current.get('item')
+        if not item or item.get('type') != 'track':
+            return None
+        track = {
+            'id': item['id'],
+            'title': item['name'],
+            'artist': ', '.join(artist['name'] for artist in item['artists']),
+            'album': item['album']['name'],
+            'year': item['album']['release_date'][:4] if item['album']['release_date'] else 'Unknown',
+            'duration_ms': item['duration_ms'],
+            'popularity': item['popularity'],
+            'progress_ms': current.get('progress_ms', 0),
+            'device': current.get('device', {}).get('name', 'Unknown Device'),
+            'image_url': item['album']['images'][0]['url'] if item['album']['images'] else None
+        }
+        remember_answer(track)
+        return track
+
+    def skip_to_next_track(self, previous_id: Optional[str] = None) -> bool:
+        """Skip to the next track and wait (briefly) for Spotify to report it.
+
+        Rather than sleeping a fixed amount, poll current_playback() after
+        exponential backoff (0.1s, 0.2s, 0.4s, 0.8s) and return as soon as the
+        track id differs from previous_id. Spotify rarely reports the new track
+        the instant next_track() returns, so there is no unslept first poll. A
+        typical skip returns after one or two polls. Worst case is 1.5s of sleep
+        plus four current_playback() round trips, and the caller's next
+        get_currently_playing() fetches again since no new track was cached. Pass previous_id when known;
+        otherwise it is looked up first.
+        """
         try:
             sp = self._get_sp()
             if not sp:
                 return False
+            if previous_id is None:
+                current_track = self.get_currently_playing()
+                previous_id = current_track['id'] if current_track else None
+            key = self._session_key()
             sp.next_track()
-            time.sleep(1.5)
+            with _playback_cache_lock:
+                _playback_cache.pop(key, None)
+            for attempt in range(4):
+                time.sleep(0.1 * 2 ** attempt)
+                track = self._track_from_playback(sp.current_playback())
+                if track and track['id'] != previous_id:
+                    # Seed the cache so the follow-up read doesn't hit Spotify again
+                    self._store_playback(key, track)
+                    break
             return True
         except Exception as e:
             print(f"Error skipping track: {e}")
@@ -111,52 +331,91 @@ class WebMusicQuiz:
 
     def calculate_score(self, user_title: str, user_artist: str, correct_title: str, correct_artist: str, response_time: float = None):
         """Calculate quiz score (title + artist = 100 points, no speed bonus)."""
-        title_similarity = fuzz.ratio(user_title.lower().strip(), correct_title.lower().strip())
-        artist_similarity = fuzz.ratio(user_artist.lower().strip(), correct_artist.lower().strip())
-
-        title_points = 0
-        artist_points = 0
-
-        # Title scoring (max 70 points)
-        if title_similarity >= 90:
-            title_points = 70
-        elif title_similarity >= 70:
-            title_points = 50
-        elif title_similarity >= 50:
-            title_points = 30
-
-        # Artist scoring (max 30 points)
-        if artist_similarity >= 90:
-            artist_points = 30
-        elif artist_similarity >= 70:
-            artist_points = 20
-        elif artist_similarity >= 50:
-            artist_points = 10
-
-        return {
-            'total_points': title_points + artist_points,
-            'title_points': title_points,
-            'artist_points': artist_points,
-            'response_time': response_time,
-            'time_message': "",
-            'title_similarity': title_similarity,
-            'artist_similarity': artist_similarity
-        }
+        return self.calculate_scores_batch([(user_title, user_artist, correct_title, correct_artist, response_time)])[0]
+
+    def calculate_scores_batch(self, pairs: Sequence[Tuple[str, str, str, str, Optional[float]]],
+                               answers_processed: bool = False) -> List[Dict]:
+        """Score many guesses at once.
+
+        Each pair is (user_title, user_artist, correct_title, correct_artist, response_time).
+        All similarities are computed in a single rapidfuzz call so the Python
+        overhead is paid once per batch rather than twice per guess.
+        Set answers_processed when the correct strings already went through
+        utils.default_process (e.g. answers from remember_answer).
+        """
+        if not pairs:
+            return []
+        # default_process is not just .lower().strip(): it also turns every non-alphanumeric
+        # character into a space, so punctuation no longer costs points
+        # ("ac-dc" vs "AC/DC" scores 100, not 80; "..." vs "…" scores 100, not 0).
+        guesses = []
+        answers = []
+        for user_title, user_artist, correct_title, correct_artist, _ in pairs:
+            guesses.extend((utils.default_process(user_title), utils.default_process(user_artist)))
+            if answers_processed:
+                answers.extend((correct_title, correct_artist))
+            else:
+                answers.extend((utils.default_process(correct_title), utils.default_process(correct_artist)))
+        # Pairs whose lengths alone rule out 0.5 score 0 without reaching rapidfuzz
+        similarities = [0.0] * len(guesses)
+        todo = [i for i in range(len(guesses)) if not cheap_reject(guesses[i], answers[i], MIN_SIMILARITY)]
+        if todo:
+            # Element-wise guess[i] vs answer[i]; same result as the diagonal of cdist.
+            # Nothing below 0.5 earns points, so let rapidfuzz bail out early (returns 0).
+            computed = process.cpdist(
+                [guesses[i] for i in todo], [answers[i] for i in todo],
+                scorer=Indel.normalized_similarity,
+                score_cutoff=MIN_SIMILARITY,
+                dtype=np.float64,
+            )
+            for i, similarity in zip(todo, computed.tolist()):
+                similarities[i] = similarity
+
+        scores = []
+        for i, pair in enumerate(pairs):
+            title_similarity = similarities[2 * i] * 100
+            artist_similarity = similarities[2 * i + 1] * 100
+            title_points = TITLE_POINTS[int(title_similarity)]
+            artist_points = ARTIST_POINTS[int(artist_similarity)]
+
+            scores.append({
+                'total_points': title_points + artist_points,
+                'title_points': title_points,
+                'artist_points': artist_points,
+                'response_time': pair[4],
+                'time_message': "",
+                'title_similarity': title_similarity,
+                'artist_similarity': artist_similarity
+            })
+        return scores
 
 # Single quiz instance for utility methods
 quiz = WebMusicQuiz()
 
 # --- Routes ---
+@app.before_request
+def require_spotify():
+    """Build the Spotipy client once for /api/ routes; answer 401 JSON if not logged in."""
+    if not request.path.startswith('/api/') or request.endpoint is None:
+        return None  # not an API route (unmatched paths fall through to 404/405)
+    if request.endpoint == 'submit_guess':
+        return None  # submit-guess scores against stored answers and doesn't need Spotify
+    sp = quiz._get_sp()
+    if not sp:
+        return jsonify({'success': False, 'message': 'Not logged in to Spotify'}), 401
+    g.sp = sp
+    return None
+
 @app.route('/')
 def index():
-    oauth = make_oauth()
+    oauth = get_oauth()
     if not oauth.get_cached_token():
         return redirect(url_for("login"))
     return render_template('updated.html')
 
 @app.route('/login')
 def login():
-    oauth = make_oauth()
+    oauth = get_oauth()
     return redirect(oauth.get_authorize_url())
 
 @app.route('/callback')
@@ -167,20 +426,17 @@ def callback():
     code = request.args.get("code")
     if not code:
         return "Missing ?code", 400
-    oauth = make_oauth()
+    oauth = get_oauth()
     oauth.get_access_token(code)  # stores tokens in the Flask session
     return redirect(url_for("index"))
 
 @app.route('/auth-url')
 def auth_url():
-    oauth = make_oauth()
+    oauth = get_oauth()
     return oauth.get_authorize_url()
 
 @app.route('/api/current-track')
 def get_current_track():
-    # Ensure logged in
-    if not make_oauth().get_cached_token():
-        return redirect(url_for("login"))
     track = quiz.get_currently_playing()
     if track:
         return jsonify({'success': True, 'track': track})
@@ -189,9 +445,13 @@ def get_current_track():
 
 @app.route('/api/skip-track', methods=['POST'])
 def skip_track():
-    if not make_oauth().get_cached_token():
-        return redirect(url_for("login"))
-    success = quiz.skip_to_next_track()
+    data = request.get_json(silent=True) or {}
+    if not isinstance(data, dict):
+        data = {}
+    previous_id = data.get('previous_id')
+    if not isinstance(previous_id, str):
+        previous_id = None  # fall back to looking up what's playing
+    success = quiz.skip_to_next_track(previous_id)
     if success:
         track = quiz.get_currently_playing()
         if track:
@@ -207,14 +467,25 @@ def submit_guess():
     data = request.json or {}
     user_title = data.get('title', '').strip()
     user_artist = data.get('artist', '').strip()
-    correct_title = data.get('correct_title', '')
-    correct_artist = data.get('correct_artist', '')
+    track_id = data.get('track_id', '')
     response_time = data.get('response_time', None)
 
     if not user_title or not user_artist:
         return jsonify({'success': False, 'message': 'Please provide both title and artist'})
 
-    score = quiz.calculate_score(user_title, user_artist, correct_title, correct_artist, response_time)
+    # The answer comes from what the server saw playing, never from the client
+    if not isinstance(track_id, str):
+        return jsonify({'success': False, 'message': 'Unknown track'})
+    with _answers_lock:
+        answer = _answers.get(track_id)
+    if not answer:
+        return jsonify({'success': False, 'message': 'Unknown track'})
+    correct_title, correct_artist, proc_title, proc_artist = answer
+
+    score = quiz.calculate_scores_batch(
+        [(user_title, user_artist, proc_title, proc_artist, response_time)],
+        answers_processed=True,
+    )[0]
     return jsonify({
         'success': True,
         'score': score,
@@ -223,16 +494,79 @@ def submit_guess():
     })
 
 # --- Socket.IO events ---
+# One monitor per logged-in session, however many tabs/sockets it has open.
+# Each session's sockets join a room named by its session key; the loop emits to that room.
+MONITOR_INTERVAL = 2.0  # seconds between Spotify polls per monitored session
+_monitors: Dict[str, Dict] = {}  # session key -> {'sids': set of sids, 'stop': Event, 'track': last pushed track}
+_monitor_keys: Dict[str, str] = {}  # sid -> session key
+_monitors_lock = threading.Lock()
+
 @socketio.on('connect')
 def handle_connect():
     print('Client connected')
     emit('connected', {'data': 'Connected to quiz server'})
 
+@socketio.on('disconnect')
+def handle_disconnect():
+    _release_monitor(request.sid)
+
+def _release_monitor(sid: str):
+    """Detach sid from its session's monitor; stop the loop once no sockets are left."""
+    with _monitors_lock:
+        key = _monitor_keys.pop(sid, None)
+        monitor = _monitors.get(key)
+        if not monitor:
+            return
+        monitor['sids'].discard(sid)
+        if monitor['sids']:
+            return
+        del _monitors[key]
+    monitor['stop'].set()
+
 @socketio.on('start_monitoring')
 def handle_start_monitoring():
-    print('Starting track monitoring')
+    sid = request.sid
+    key = quiz._session_key()
+    if not key:
+        emit('monitoring_error', {'message': 'Not logged in to Spotify'})
+        return
+    if _monitor_keys.get(sid) not in (None, key):
+        _release_monitor(sid)  # token changed since this socket last asked
+    join_room(key)
+
+    with _monitors_lock:
+        _monitor_keys[sid] = key
+        monitor = _monitors.get(key)
+        is_new = monitor is None
+        if is_new:
+            monitor = {'sids': set(), 'stop': threading.Event(), 'track': None}
+            _monitors[key] = monitor
+        monitor['sids'].add(sid)
+        last_track = monitor['track']
+
+    if is_new:
+        # The loop runs outside any request, so give it its own copy of the token
+        oauth = make_oauth(MemoryCacheHandler(get_oauth().get_cached_token()))
+        socketio.start_background_task(monitor_loop, key, oauth, monitor)
+        print('Starting track monitoring')
+    elif last_track:
+        # Joining a running monitor: catch this socket up instead of waiting for the next change
+        emit('track_update', {'success': True, 'track': last_track})
     emit('monitoring_started', {'message': 'Track monitoring started'})
 
+def monitor_loop(key: str, oauth: SpotifyOAuth, monitor: Dict):
+    """Poll Spotify for one session and push 'track_update' to its room only when the track changes."""
+    last_id = None
+    while not monitor['stop'].is_set():
+        track = quiz.get_currently_playing(oauth)
+        track_id = track['id'] if track else None
+        if track_id != last_id:
+            last_id = track_id
+            with _monitors_lock:
+                monitor['track'] = track
+            socketio.emit('track_update', {'success': track is not None, 'track': track}, to=key)
+        socketio.sleep(MONITOR_INTERVAL)
+
 # --- Entry points ---
 if __name__ == '__main__':
     # Local dev server with websockets